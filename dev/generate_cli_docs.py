@@ -6,7 +6,9 @@ This script uses md-click as the foundation but generates enhanced markdown
 documentation that's suitable for inclusion in the CocoIndex documentation site.
 """
 
+import io
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import re
 import click
@@ -17,6 +19,30 @@ project_root = Path(__file__).parent.parent
 python_path = project_root / "python"
 sys.path.insert(0, str(python_path))
 
+# Precompiled patterns, to avoid re-compiling (or re-fetching from the regex
+# cache) on every call for every line of every command's help text.
+_URL_PLACEHOLDER_RE = re.compile(r"http://localhost:<[^>]+>|https://[^<\s]+<[^>]+>")
+_URL_LIST_RE = re.compile(r"(?<!`)(\bhttps?://[^\s,`]+,https?://[^\s`]+)(?!`)")
+_URL_STANDALONE_RE = re.compile(r"(?<!`)(?<!,)(\bhttps?://[^\s,`]+)(?!`)(?!,)")
+_INLINE_CODE_SPLIT_RE = re.compile(r"(`[^`]*`)")
+
+# Translation table for escaping HTML-like tags in a single C-level pass.
+_HTML_ESCAPE_TABLE = str.maketrans({"<": "&lt;", ">": "&gt;"})
+
+# Fixed markdown layout for one subcommand entry; desc_block and opts_block are
+# either empty or carry their own surrounding newlines.
+_SUBCMD_TEMPLATE = """
+### `{name}`
+{desc_block}
+**Usage:**
+
+```bash
+{usage}
+```
+{opts_block}
+---
+"""
+
 
 def clean_usage_line(usage: str) -> str:
     """Clean up the usage line to remove 'cli' and make it generic, and remove the 'Usage:' prefix."""
@@ -30,27 +56,32 @@ def clean_usage_line(usage: str) -> str:
 
 def escape_html_tags(text: str) -> str:
     """Escape HTML-like tags in text to prevent MDX parsing issues, but preserve them in code blocks."""
-    import re
+    # Fast path: without inline code there is nothing to preserve, and without
+    # a URL there is nothing to wrap, so at most a single translate pass is
+    # needed - and none at all if there are no tags to escape either.
+    if "`" not in text and "http" not in text:
+        if "<" not in text and ">" not in text:
+            return text
+        return text.translate(_HTML_ESCAPE_TABLE)
 
     # Handle special cases where URLs with placeholders should be wrapped in code blocks
-    text = re.sub(r"http://localhost:<([^>]+)>", r"`http://localhost:<\1>`", text)
-    text = re.sub(r"https://([^<\s]+)<([^>]+)>", r"`https://\1<\2>`", text)
+    text = _URL_PLACEHOLDER_RE.sub(r"`\g<0>`", text)
 
     # Handle comma-separated URL examples specifically (e.g., "https://site1.com,http://localhost:3000")
-    text = re.sub(r"(?<!`)(\bhttps?://[^\s,`]+,https?://[^\s`]+)(?!`)", r"`\1`", text)
+    text = _URL_LIST_RE.sub(r"`\1`", text)
 
     # Handle standalone URLs that aren't already wrapped in backticks
-    text = re.sub(r"(?<!`)(?<!,)(\bhttps?://[^\s,`]+)(?!`)(?!,)", r"`\1`", text)
+    text = _URL_STANDALONE_RE.sub(r"`\1`", text)
 
     # Split text into code blocks and regular text
     # Pattern matches: `code content` (inline code blocks)
-    parts = re.split(r"(`[^`]*`)", text)
+    parts = _INLINE_CODE_SPLIT_RE.split(text)
 
     result = []
     for i, part in enumerate(parts):
         if i % 2 == 0:
             # Even indices are regular text, escape HTML tags
-            result.append(part.replace("<", "&lt;").replace(">", "&gt;"))
+            result.append(part.translate(_HTML_ESCAPE_TABLE))
         else:
             # Odd indices are code blocks, preserve as-is
             result.append(part)
@@ -58,129 +89,41 @@ def escape_html_tags(text: str) -> str:
     return "".join(result)
 
 
-def format_options_section(help_text: str) -> str:
-    """Extract and format the options section."""
-    lines = help_text.split("\n")
-    options_start = None
-    commands_start = None
-
-    for i, line in enumerate(lines):
-        if line.strip() == "Options:":
-            options_start = i
-        elif line.strip() == "Commands:":
-            commands_start = i
-            break
-
-    if options_start is None:
-        return ""
-
-    # Extract options section
-    end_idx = commands_start if commands_start else len(lines)
-    options_lines = lines[options_start + 1 : end_idx]  # Skip "Options:" header
-
-    # Parse options - each option starts with exactly 2 spaces and a dash
-    formatted_options = []
-    current_option = None
-    current_description = []
-
-    for line in options_lines:
-        if not line.strip():  # Empty line
-            continue
-
-        # Check if this is a new option line (starts with exactly 2 spaces then -)
-        if line.startswith("  -") and not line.startswith("   "):
-            # Save previous option if exists
-            if current_option is not None:
-                desc = " ".join(current_description).strip()
-                desc = escape_html_tags(desc)  # Escape HTML tags for MDX compatibility
-                formatted_options.append(f"| `{current_option}` | {desc} |")
-
-            # Remove the leading 2 spaces
-            content = line[2:]
-
-            # Find the position where we have multiple consecutive spaces (start of description)
-            match = re.search(r"\s{2,}", content)
-            if match:
-                # Split at the first occurrence of multiple spaces
-                option_part = content[: match.start()]
-                desc_part = content[match.end() :]
-                current_option = option_part.strip()
-                current_description = [desc_part.strip()] if desc_part.strip() else []
-            else:
-                # No description on this line, just the option
-                current_option = content.strip()
-                current_description = []
-        else:
-            # Continuation line (starts with more than 2 spaces)
-            if current_option is not None and line.strip():
-                current_description.append(line.strip())
-
-    # Add last option
-    if current_option is not None:
-        desc = " ".join(current_description).strip()
-        desc = escape_html_tags(desc)  # Escape HTML tags for MDX compatibility
-        formatted_options.append(f"| `{current_option}` | {desc} |")
-
-    if formatted_options:
-        header = "| Option | Description |\n|--------|-------------|"
-        return f"{header}\n" + "\n".join(formatted_options) + "\n"
-
-    return ""
-
-
-def format_commands_section(help_text: str) -> str:
-    """Extract and format the commands section."""
-    lines = help_text.split("\n")
-    commands_start = None
-
-    for i, line in enumerate(lines):
-        if line.strip() == "Commands:":
-            commands_start = i
-            break
-
-    if commands_start is None:
-        return ""
-
-    # Extract commands section
-    commands_lines = lines[commands_start + 1 :]
-
-    # Parse commands - each command starts with 2 spaces then the command name
-    formatted_commands = []
-
-    for line in commands_lines:
-        if not line.strip():  # Empty line
-            continue
-
-        # Check if this is a command line (starts with 2 spaces + command name)
-        match = re.match(r"^  (\w+)\s{2,}(.+)$", line)
-        if match:
-            command = match.group(1)
-            description = match.group(2).strip()
-            # Truncate long descriptions
-            if len(description) > 80:
-                description = description[:77] + "..."
-            formatted_commands.append(f"| `{command}` | {description} |")
-
-    if formatted_commands:
-        header = "| Command | Description |\n|---------|-------------|"
-        return f"{header}\n" + "\n".join(formatted_commands) + "\n"
+def format_options_section(cmd: click.Command, ctx: click.Context) -> str:
+    """Format the command's options as a markdown table from Click metadata."""
+    # Read the structured (opts, help) records directly instead of parsing
+    # them back out of the rendered help text.
+    rows = [
+        record
+        for param in cmd.get_params(ctx)
+        if (record := param.get_help_record(ctx)) is not None
+    ]
+
+    if rows:
+        # Collapse whitespace runs as the rendered-text parser used to, then
+        # escape HTML tags for MDX compatibility
+        return (
+            "| Option | Description |\n|--------|-------------|\n"
+            + "\n".join(
+                f"| `{option}` | {escape_html_tags(' '.join(desc.split()))} |"
+                for option, desc in rows
+            )
+            + "\n"
+        )
 
     return ""
 
 
 def extract_description(help_text: str) -> str:
-    """Extract the main description from help text."""
-    lines = help_text.split("\n")
-
+    """Extract the main description from rendered help text."""
     # Find the description between usage and options/commands
     description_lines = []
     in_description = False
 
-    for line in lines:
+    for line in help_text.splitlines():
         if line.startswith("Usage:"):
             in_description = True
-            continue
-        elif line.strip() in ["Options:", "Commands:"]:
+        elif line.strip() in ("Options:", "Commands:"):
             break
         elif in_description:
             stripped = line.strip()
@@ -197,53 +140,38 @@ def extract_description(help_text: str) -> str:
 def generate_command_docs(cmd: click.Group) -> str:
     """Generate markdown documentation for all commands."""
 
-    markdown_content = []
+    buf = io.StringIO()
 
     # Disable lint warnings for about "first line in file should be a top level heading"
     # We intentionally start with a level 2 heading below, as this file is imported into another file.
-    markdown_content.append("<!-- markdownlint-disable MD041 -->")
-    markdown_content.append("")
-
     # Add top-level heading to satisfy MD041 linting rule
-    markdown_content.append("## Subcommands Reference")
-    markdown_content.append("")
+    buf.write("<!-- markdownlint-disable MD041 -->\n\n## Subcommands Reference\n")
 
     ctx = click.core.Context(cmd, info_name=cmd.name)
-    subcommands = list(cmd.commands.values())
-    # Generate only the command details section (remove redundant headers)
-    for sub_cmd in sorted(subcommands, key=lambda x: x.name or ""):
+
+    def render_subcommand(sub_cmd: click.Command) -> str:
         sub_ctx = click.core.Context(sub_cmd, info_name=sub_cmd.name, parent=ctx)
-        command_name = sub_cmd.name
-        help_text = sub_cmd.get_help(sub_ctx)
         usage = clean_usage_line(sub_cmd.get_usage(sub_ctx))
-        description = extract_description(help_text)
-
-        markdown_content.append(f"### `{command_name}`")
-        markdown_content.append("")
-
-        if description:
-            markdown_content.append(description)
-            markdown_content.append("")
-
-        # Add usage
-        markdown_content.append("**Usage:**")
-        markdown_content.append("")
-        markdown_content.append(f"```bash")
-        markdown_content.append(usage)
-        markdown_content.append("```")
-        markdown_content.append("")
-
-        # Add options if any
-        options_section = format_options_section(help_text)
-        if options_section:
-            markdown_content.append("**Options:**")
-            markdown_content.append("")
-            markdown_content.append(options_section)
-
-        markdown_content.append("---")
-        markdown_content.append("")
+        description = extract_description(sub_cmd.get_help(sub_ctx))
+        options_section = format_options_section(sub_cmd, sub_ctx)
+        return _SUBCMD_TEMPLATE.format(
+            name=sub_cmd.name,
+            desc_block=f"\n{description}\n" if description else "",
+            usage=usage,
+            opts_block=(
+                f"\n**Options:**\n\n{options_section}" if options_section else ""
+            ),
+        )
+
+    # Each subcommand's help rendering is independent, so render them in
+    # parallel; executor.map preserves the sorted order for emission.
+    # Generate only the command details section (remove redundant headers)
+    subcommands = sorted(cmd.commands.values(), key=lambda x: x.name or "")
+    with ThreadPoolExecutor() as executor:
+        for block in executor.map(render_subcommand, subcommands):
+            buf.write(block)
 
-    return "\n".join(markdown_content)
+    return buf.getvalue()
 
 
 def main() -> None:
@@ -262,20 +190,21 @@ def main() -> None:
         docs_dir.mkdir(parents=True, exist_ok=True)
 
         # Write the generated documentation
+        new_bytes = markdown_content.encode("utf-8")
         content_changed = True
-        if output_file.exists():
-            with open(output_file, "r", encoding="utf-8") as f:
-                existing_content = f.read()
-            content_changed = existing_content != markdown_content
+        if output_file.exists() and output_file.stat().st_size == len(new_bytes):
+            # Compare bytes only when sizes match, since a size mismatch
+            # already proves the file is stale without reading it.
+            content_changed = output_file.read_bytes() != new_bytes
 
         if content_changed:
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(markdown_content)
+            output_file.write_bytes(new_bytes)
 
             print(f"CLI documentation generated successfully at: {output_file}")
-            print(
-                f"Generated {len(markdown_content.splitlines())} lines of documentation"
-            )
+            # The content always ends with a newline, so counting b"\n" at the
+            # byte level matches splitlines() without re-scanning the string.
+            line_count = new_bytes.count(b"\n")
+            print(f"Generated {line_count} lines of documentation")
         else:
             print(f"CLI documentation is up to date at: {output_file}")
 